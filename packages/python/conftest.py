@@ -0,0 +1 @@
+"""Make the in-tree package importable when running pytest from here."""
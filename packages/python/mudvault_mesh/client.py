@@ -5,18 +5,75 @@ This module provides the main MeshClient class for connecting to the MudVault Me
 """
 
 import asyncio
+import dataclasses
+import itertools
 import json
 import logging
+import random
+import re
+import sys
 import time
-from typing import Callable, Optional, Dict, Any, Union
+import uuid
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from typing import Callable, Deque, Optional, Dict, Any, Tuple, Union
 import websockets
 from websockets.exceptions import ConnectionClosed, InvalidHandshake
 
+# Fastest available JSON codec: msgspec, then orjson, then stdlib json
+try:
+    import msgspec.json
+
+    _msgspec_decode = msgspec.json.Decoder().decode
+    _msgspec_encode = msgspec.json.Encoder().encode
+
+    def _json_loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        return _msgspec_decode(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _msgspec_encode(obj)
+
+    _JSON_DECODE_ERRORS: tuple = (msgspec.DecodeError,)
+
+except ImportError:
+    try:
+        import orjson
+
+        def _json_loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+            return orjson.loads(data)
+
+        def _json_dumps(obj: Any) -> bytes:
+            return orjson.dumps(obj)
+
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+    except ImportError:
+        def _json_loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+            if isinstance(data, memoryview):
+                data = data.tobytes()
+            return json.loads(data)
+
+        def _json_dumps(obj: Any) -> bytes:
+            return json.dumps(obj).encode("utf-8")
+
+        _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+# uvloop gives 2-4x throughput for websockets-heavy asyncio workloads;
+# opted into per client via MeshClientOptions.use_uvloop, never as an
+# import side effect on the host application's loop policy
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
+
 from .types import (
     MeshMessage,
     MessageEndpoint,
+    MessageMetadata,
     MessageType,
     ConnectionState,
+    ErrorCodes,
     MeshClientOptions,
     UserInfo,
     PresencePayload,
@@ -29,7 +86,6 @@ from .utils import (
     create_who_request_message,
     create_finger_request_message,
     create_locate_request_message,
-    create_ping_message,
     create_pong_message,
     validate_mud_name,
 )
@@ -38,6 +94,80 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 
+# Heartbeat frames have a fixed shape; sniff them cheaply before paying
+# for a full JSON parse. The sniff token must appear before the
+# "payload" key: quoted string values escape embedded quotes so they
+# cannot match, but nested objects (error.details, finger.info, ...)
+# may legally contain heartbeat-shaped keys — those always sit inside
+# the payload, so anything at or past it falls through to a full parse.
+_PING_SNIFF_B = b'"type":"ping"'
+_PONG_SNIFF_B = b'"type":"pong"'
+_PING_SNIFF_S = '"type":"ping"'
+_PONG_SNIFF_S = '"type":"pong"'
+_PAYLOAD_KEY_B = b'"payload"'
+_PAYLOAD_KEY_S = '"payload"'
+_TIMESTAMP_RE_B = re.compile(rb'"timestamp"\s*:\s*(\d+)')
+_TIMESTAMP_RE_S = re.compile(r'"timestamp"\s*:\s*(\d+)')
+
+# Placeholders patched into the pre-serialized ping template per send.
+# The payload placeholder is numeric so it round-trips any JSON encoder.
+_PING_ID_PLACEHOLDER = b"@PING-ID@"
+_PING_ISO_PLACEHOLDER = b"@PING-TS@"
+_PING_MS_PLACEHOLDER = b"1234567890987654321"
+
+# How long to wait for an explicit auth ack before assuming success
+# (gateways that do not ack still authenticate within this window)
+_AUTH_ACK_TIMEOUT = 1.0
+
+
+def _endpoint_to_dict(endpoint: MessageEndpoint) -> Dict[str, Any]:
+    """Serialize an endpoint, skipping unset optional fields inline."""
+    d: Dict[str, Any] = {"mud": endpoint.mud}
+    if endpoint.user is not None:
+        d["user"] = endpoint.user
+    if endpoint.display_name is not None:
+        d["displayName"] = endpoint.display_name
+    if endpoint.channel is not None:
+        d["channel"] = endpoint.channel
+    return d
+
+
+def _metadata_to_dict(metadata: Any) -> Dict[str, Any]:
+    """Serialize message metadata (no optional fields to strip)."""
+    if isinstance(metadata, dict):
+        return {k: v for k, v in metadata.items() if v is not None}
+    return {
+        "priority": metadata.priority,
+        "ttl": metadata.ttl,
+        "encoding": metadata.encoding,
+        "language": metadata.language,
+        "retry": metadata.retry,
+    }
+
+
+# Field names per payload dataclass, computed once on first use
+_PAYLOAD_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _payload_to_dict(payload: Any) -> Any:
+    """Serialize a payload dataclass or dict, skipping None values."""
+    if isinstance(payload, dict):
+        return {k: v for k, v in payload.items() if v is not None}
+
+    cls = payload.__class__
+    names = _PAYLOAD_FIELDS.get(cls)
+    if names is None:
+        names = tuple(f.name for f in dataclasses.fields(cls))
+        _PAYLOAD_FIELDS[cls] = names
+
+    d: Dict[str, Any] = {}
+    for name in names:
+        value = getattr(payload, name)
+        if value is not None:
+            d[name] = value
+    return d
+
+
 class MeshClient:
     """
     Client for connecting to MudVault Mesh network.
@@ -61,20 +191,92 @@ class MeshClient:
         
         self.options = options
         self.state = ConnectionState()
+
+        # Counter-based message ids: one random v4 UUID per client, then a
+        # cheap increment in its node field instead of a full uuid4 per
+        # message. Keeping the version/variant nibbles means every id
+        # still validates as a UUID (the gateway rejects anything else).
+        self._id_prefix = str(uuid.uuid4())[:24]
+        self._id_counter = itertools.count()
+
+        # Endpoints reused across every send instead of per-call allocation
+        self._self_endpoint = MessageEndpoint(mud=options.mud_name)
+        self._gateway_endpoint = MessageEndpoint(mud="Gateway")
+        self._user_endpoints: Dict[str, MessageEndpoint] = {}
+
         self._websocket: Optional[websockets.WebSocketServerProtocol] = None
         self._gateway_url = ""
         self._api_key: Optional[str] = None
         
         # Event handlers
-        self._handlers: Dict[str, list] = {}
+        self._handlers: Dict[str, list] = defaultdict(list)
+
+        # O(1) dispatch for message types with dedicated handling
+        self._type_handlers: Dict[str, Callable] = {
+            "auth": self._handle_auth,
+            "ping": self._handle_ping,
+            "pong": self._handle_pong,
+            "error": self._handle_error,
+        }
+
+        # Resolved by the auth ack (or auth error) from the gateway
+        self._auth_future: Optional[asyncio.Future] = None
+
+        # Heartbeat timestamps live in plain attributes; every inbound
+        # message touches _last_pong_mono, so skip the state indirection
+        # and mirror into ConnectionState only on introspection
+        self._last_ping_mono: float = 0.0
+        self._last_pong_mono: float = 0.0
+
+        # Pending async handler calls, drained by the dispatch task
+        self._pending_events: Deque[Tuple[Callable, tuple, dict]] = deque()
+        self._dispatch_wake: Optional[asyncio.Future] = None
         
+        # Outbound queue of encoded text frames, drained by the writer
+        self._out_queue: Optional["asyncio.Queue[str]"] = None
+
+        # Wire-dict reused across sends; safe because serialization
+        # completes before _send_message hits an await
+        self._scratch: Dict[str, Any] = {}
+
+        # Heartbeat pings are >90% invariant; serialize the frame once
+        # and patch only id and timestamps per send
+        self._ping_template: bytes = _json_dumps({
+            "version": "1.0",
+            "id": _PING_ID_PLACEHOLDER.decode(),
+            "timestamp": _PING_ISO_PLACEHOLDER.decode(),
+            "type": "ping",
+            "from": {"mud": options.mud_name},
+            "to": {"mud": "Gateway"},
+            "payload": {"timestamp": int(_PING_MS_PLACEHOLDER)},
+            "metadata": _metadata_to_dict(MessageMetadata()),
+        })
+
         # Background tasks
         self._heartbeat_task: Optional[asyncio.Task] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._dispatch_task: Optional[asyncio.Task] = None
+        self._auth_task: Optional[asyncio.Task] = None
         self._reconnect_task: Optional[asyncio.Task] = None
         
         # Setup logging
         self._setup_logging()
     
+    def _next_id(self) -> str:
+        """Return a unique RFC-4122-shaped id without a per-message uuid4."""
+        # The mask keeps the counter inside the 48-bit node field
+        return f"{self._id_prefix}{next(self._id_counter) & 0xFFFFFFFFFFFF:012x}"
+
+    def _user_endpoint(self, user: str) -> MessageEndpoint:
+        """Return a cached from-endpoint for a user of this MUD."""
+        endpoint = self._user_endpoints.get(user)
+        if endpoint is None:
+            if len(self._user_endpoints) >= 1024:
+                self._user_endpoints.clear()
+            endpoint = MessageEndpoint(mud=self.options.mud_name, user=user)
+            self._user_endpoints[user] = endpoint
+        return endpoint
+
     def _setup_logging(self) -> None:
         """Setup logging for the client."""
         if not logger.handlers:
@@ -88,31 +290,66 @@ class MeshClient:
     
     def on(self, event: str, handler: Callable) -> None:
         """Register an event handler."""
-        if event not in self._handlers:
-            self._handlers[event] = []
-        self._handlers[event].append(handler)
-    
+        # Classify once at registration; _emit only branches on the flag
+        self._handlers[event].append((handler, asyncio.iscoroutinefunction(handler)))
+
     def off(self, event: str, handler: Optional[Callable] = None) -> None:
         """Remove an event handler."""
         if event not in self._handlers:
             return
-        
+
         if handler is None:
             self._handlers[event] = []
-        elif handler in self._handlers[event]:
-            self._handlers[event].remove(handler)
-    
+        else:
+            # Compare by equality, not identity: bound methods are equal
+            # across references but never identical
+            self._handlers[event] = [
+                entry for entry in self._handlers[event] if entry[0] != handler
+            ]
+
     def _emit(self, event: str, *args, **kwargs) -> None:
         """Emit an event to all registered handlers."""
-        if event in self._handlers:
-            for handler in self._handlers[event]:
-                try:
-                    if asyncio.iscoroutinefunction(handler):
-                        asyncio.create_task(handler(*args, **kwargs))
-                    else:
-                        handler(*args, **kwargs)
-                except Exception as e:
-                    logger.error(f"Error in event handler for {event}: {e}")
+        handlers = self._handlers.get(event)
+        if not handlers:
+            return
+
+        for handler, is_coro in handlers:
+            try:
+                if is_coro:
+                    self._schedule_async_handler(handler, args, kwargs)
+                else:
+                    handler(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Error in event handler for {event}: {e}")
+
+    def _schedule_async_handler(self, handler: Callable, args: tuple, kwargs: dict) -> None:
+        """Queue an async handler call for the dispatch task."""
+        if self._dispatch_task is None or self._dispatch_task.done():
+            # Dispatch task not running (e.g. events around connect/disconnect)
+            asyncio.create_task(handler(*args, **kwargs))
+            return
+
+        self._pending_events.append((handler, args, kwargs))
+        if self._dispatch_wake and not self._dispatch_wake.done():
+            self._dispatch_wake.set_result(None)
+
+    async def _dispatch_loop(self) -> None:
+        """Run queued async handlers without a Task allocation per event."""
+        try:
+            while True:
+                if not self._pending_events:
+                    self._dispatch_wake = asyncio.get_running_loop().create_future()
+                    await self._dispatch_wake
+                    self._dispatch_wake = None
+
+                while self._pending_events:
+                    handler, args, kwargs = self._pending_events.popleft()
+                    try:
+                        await handler(*args, **kwargs)
+                    except Exception as e:
+                        logger.error(f"Error in event handler: {e}")
+        except asyncio.CancelledError:
+            pass
     
     async def connect(
         self,
@@ -131,17 +368,35 @@ class MeshClient:
         
         self._gateway_url = gateway_url
         self._api_key = api_key
+
+        if (self.options.use_uvloop and uvloop is not None
+                and not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)):
+            # Takes effect for loops created after this call (e.g. a
+            # later asyncio.run); callers who want the current loop
+            # accelerated should uvloop.install() before starting it
+            uvloop.install()
         
         try:
             logger.info(f"Connecting to {gateway_url}")
             
+            # MUD traffic is many small JSON frames: permessage-deflate
+            # costs CPU per frame for little gain, the protocol-level
+            # ping is redundant with our own heartbeat, and a deeper
+            # receive queue absorbs bursts without back-pressure stalls
             self._websocket = await asyncio.wait_for(
-                websockets.connect(gateway_url),
+                websockets.connect(
+                    gateway_url,
+                    compression=None,
+                    ping_interval=None,
+                    max_queue=256,
+                    max_size=2 ** 20,
+                ),
                 timeout=self.options.timeout
             )
             
             self.state.connected = True
             self.state.reconnect_attempts = 0
+            self._out_queue = asyncio.Queue(maxsize=1024)
             
             logger.info("Connected to MudVault Mesh")
             self._emit("connected")
@@ -185,120 +440,200 @@ class MeshClient:
         """Authenticate with the gateway."""
         auth_message = create_message(
             "auth",
-            MessageEndpoint(mud=self.options.mud_name),
-            MessageEndpoint(mud="Gateway"),
+            self._self_endpoint,
+            self._gateway_endpoint,
             AuthPayload(
                 mud_name=self.options.mud_name,
                 token=self._api_key
-            )
+            ),
+            id_factory=self._next_id
         )
         
+        self._auth_future = asyncio.get_running_loop().create_future()
         await self._send_message(auth_message)
-        
-        # Wait a bit for potential auth error
-        await asyncio.sleep(1.0)
-        
-        if self.state.connected:  # If still connected, assume auth succeeded
+
+        # The listen loop starts right after this method returns, so the
+        # ack is awaited in a companion task instead of a blocking sleep
+        self._auth_task = asyncio.create_task(self._finish_authentication())
+
+    async def _finish_authentication(self) -> None:
+        """Wait for the gateway's auth response without blocking connect."""
+        try:
+            await asyncio.wait_for(self._auth_future, timeout=_AUTH_ACK_TIMEOUT)
+        except asyncio.TimeoutError:
+            # No explicit ack; if still connected, assume auth succeeded
+            pass
+        except Exception as e:
+            logger.error(f"Authentication failed: {e}")
+            self._emit("error", f"Authentication failed: {e}")
+            if self._websocket:
+                await self._websocket.close()
+            return
+        finally:
+            self._auth_future = None
+
+        if self.state.connected:
             self.state.authenticated = True
             logger.info("Authenticated with MudVault Mesh")
             self._emit("authenticated")
+
+    async def _handle_auth(self, message: MeshMessage) -> None:
+        """Handle the gateway's auth response."""
+        payload = message.payload
+        failed = isinstance(payload, dict) and payload.get("success") is False
+
+        if self._auth_future and not self._auth_future.done():
+            if failed:
+                self._auth_future.set_exception(
+                    ConnectionError(f"Authentication rejected: {payload.get('message', 'unknown reason')}")
+                )
+            else:
+                self._auth_future.set_result(None)
+
+        self._emit("message", message)
+        self._emit("auth", message)
     
     async def _listen(self) -> None:
         """Listen for incoming messages."""
         try:
-            while self.state.connected and self._websocket:
-                try:
-                    message_data = await self._websocket.recv()
-                    await self._handle_message(message_data)
-                    
-                except ConnectionClosed:
-                    logger.info("Connection closed by server")
-                    break
-                except Exception as e:
-                    logger.error(f"Error receiving message: {e}")
-                    
+            # The iterator terminates cleanly when the connection closes,
+            # replacing the manual recv/except loop
+            async for message_data in self._websocket:
+                await self._handle_message(message_data)
+            logger.info("Connection closed by server")
+        except ConnectionClosed:
+            logger.info("Connection closed by server")
         except Exception as e:
             logger.error(f"Listen loop error: {e}")
         finally:
             await self._handle_disconnection()
     
-    async def _handle_message(self, data: Union[str, bytes]) -> None:
+    async def _handle_message(self, data: Union[str, bytes, bytearray]) -> None:
         """Handle an incoming message."""
         try:
-            if isinstance(data, bytes):
-                data = data.decode('utf-8')
-            
-            message_dict = json.loads(data)
+            # Heartbeat fast path first; inside the try so a failed
+            # ping reply degrades to a per-message error like any other
+            # handler instead of killing the listen loop
+            if await self._maybe_fast_heartbeat(data):
+                return
+
+            # orjson (and stdlib json) parse bytes directly; no utf-8 pre-decode
+            message_dict = _json_loads(data)
             message = self._parse_message(message_dict)
             
             # Update last activity
-            self.state.last_pong = time.time()
+            self._last_pong_mono = time.monotonic()
             
             # Handle special message types
-            if message.type == "ping":
-                await self._handle_ping(message)
-            elif message.type == "pong":
-                await self._handle_pong(message)
-            elif message.type == "error":
-                await self._handle_error(message)
+            handler = self._type_handlers.get(message.type)
+            if handler is not None:
+                await handler(message)
             else:
                 # Emit generic message event
                 self._emit("message", message)
                 # Emit specific message type event
                 self._emit(message.type, message)
                 
-        except json.JSONDecodeError as e:
+        except _JSON_DECODE_ERRORS as e:
             logger.error(f"Failed to parse message JSON: {e}")
             self._emit("error", f"Invalid JSON received: {e}")
         except Exception as e:
             logger.error(f"Error handling message: {e}")
             self._emit("error", f"Message handling error: {e}")
     
+    async def _maybe_fast_heartbeat(self, data: Union[str, bytes, bytearray]) -> bool:
+        """Handle ping/pong frames without a full JSON parse.
+
+        Returns True if the frame was consumed as a heartbeat.
+        """
+        if isinstance(data, (bytes, bytearray)):
+            payload_at = data.find(_PAYLOAD_KEY_B)
+            if payload_at < 0:
+                return False
+            # Only a top-level type key (before the payload) qualifies
+            type_at = data.find(_PING_SNIFF_B, 0, payload_at)
+            is_ping = type_at >= 0
+            is_pong = not is_ping and data.find(_PONG_SNIFF_B, 0, payload_at) >= 0
+            if not (is_ping or is_pong):
+                return False
+            match = _TIMESTAMP_RE_B.search(data, payload_at)
+        else:
+            payload_at = data.find(_PAYLOAD_KEY_S)
+            if payload_at < 0:
+                return False
+            type_at = data.find(_PING_SNIFF_S, 0, payload_at)
+            is_ping = type_at >= 0
+            is_pong = not is_ping and data.find(_PONG_SNIFF_S, 0, payload_at) >= 0
+            if not (is_ping or is_pong):
+                return False
+            match = _TIMESTAMP_RE_S.search(data, payload_at)
+
+        if not match:
+            return False
+
+        self._last_pong_mono = time.monotonic()
+
+        if is_ping:
+            pong_message = create_pong_message(
+                self._self_endpoint,
+                self._gateway_endpoint,
+                int(match.group(1)),
+                id_factory=self._next_id
+            )
+            await self._send_message(pong_message)
+        else:
+            latency = time.time_ns() // 1_000_000 - int(match.group(1))
+            self._emit("pong", {"latency": latency})
+
+        return True
+
     def _parse_message(self, data: Dict[str, Any]) -> MeshMessage:
         """Parse a message dictionary into a MeshMessage object."""
-        # Basic validation
-        required_fields = ["version", "id", "timestamp", "type", "from", "to", "payload", "metadata"]
-        for field in required_fields:
-            if field not in data:
-                raise ValueError(f"Missing required field: {field}")
-        
-        # Convert from/to dicts to MessageEndpoint objects
-        from_endpoint = MessageEndpoint(**data["from"])
-        to_endpoint = MessageEndpoint(**data["to"])
-        
-        # Create message object
-        return MeshMessage(
-            version=data["version"],
-            id=data["id"],
-            timestamp=data["timestamp"],
-            type=data["type"],
-            from_endpoint=from_endpoint,
-            to_endpoint=to_endpoint,
-            payload=data["payload"],
-            metadata=data["metadata"],
-            signature=data.get("signature")
-        )
+        # Direct indexing doubles as validation: a missing key raises
+        # KeyError once instead of a per-field membership loop
+        try:
+            return MeshMessage(
+                version=data["version"],
+                id=data["id"],
+                timestamp=data["timestamp"],
+                # Interning lets dispatch-dict lookups hit pointer equality
+                type=sys.intern(data["type"]),
+                from_endpoint=MessageEndpoint(**data["from"]),
+                to_endpoint=MessageEndpoint(**data["to"]),
+                payload=data["payload"],
+                metadata=data["metadata"],
+                signature=data.get("signature")
+            )
+        except KeyError as e:
+            raise ValueError(f"Missing required field: {e.args[0]}") from None
     
     async def _handle_ping(self, message: MeshMessage) -> None:
         """Handle incoming ping message."""
         if isinstance(message.payload, dict) and "timestamp" in message.payload:
             pong_message = create_pong_message(
-                MessageEndpoint(mud=self.options.mud_name),
-                MessageEndpoint(mud="Gateway"),
-                message.payload["timestamp"]
+                self._self_endpoint,
+                self._gateway_endpoint,
+                message.payload["timestamp"],
+                id_factory=self._next_id
             )
             await self._send_message(pong_message)
     
     async def _handle_pong(self, message: MeshMessage) -> None:
         """Handle incoming pong message."""
         if isinstance(message.payload, dict) and "timestamp" in message.payload:
-            latency = time.time() * 1000 - message.payload["timestamp"]
+            latency = time.time_ns() // 1_000_000 - message.payload["timestamp"]
             self._emit("pong", {"latency": latency})
     
     async def _handle_error(self, message: MeshMessage) -> None:
         """Handle incoming error message."""
         if isinstance(message.payload, dict):
             error_msg = f"Server error {message.payload.get('code', 'Unknown')}: {message.payload.get('message', 'Unknown error')}"
+
+            if (self._auth_future and not self._auth_future.done()
+                    and message.payload.get('code') == ErrorCodes.AUTHENTICATION_FAILED):
+                self._auth_future.set_exception(ConnectionError(error_msg))
+                return
+
             logger.error(error_msg)
             self._emit("error", error_msg)
     
@@ -321,9 +656,17 @@ class MeshClient:
     async def _schedule_reconnect(self) -> None:
         """Schedule a reconnection attempt."""
         self.state.reconnect_attempts += 1
-        delay = self.options.reconnect_interval * (2 ** (self.state.reconnect_attempts - 1))
-        
-        logger.info(f"Scheduling reconnect attempt {self.state.reconnect_attempts} in {delay}s")
+
+        # Capped exponential backoff with jitter so a fleet of clients
+        # does not retry in lockstep after a gateway restart
+        base = self.options.reconnect_interval
+        ceiling = min(
+            self.options.reconnect_max_interval,
+            base * (2 ** min(self.state.reconnect_attempts - 1, 6)),
+        )
+        delay = random.uniform(base, ceiling) if ceiling > base else ceiling
+
+        logger.info(f"Scheduling reconnect attempt {self.state.reconnect_attempts} in {delay:.1f}s")
         self._emit("reconnecting", {"attempt": self.state.reconnect_attempts})
         
         await asyncio.sleep(delay)
@@ -343,7 +686,9 @@ class MeshClient:
     def _start_background_tasks(self) -> None:
         """Start background tasks."""
         self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
-    
+        self._writer_task = asyncio.create_task(self._writer_loop())
+        self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+
     async def _stop_background_tasks(self) -> None:
         """Stop background tasks."""
         if self._heartbeat_task:
@@ -353,7 +698,31 @@ class MeshClient:
             except asyncio.CancelledError:
                 pass
             self._heartbeat_task = None
-        
+
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+
+        if self._dispatch_task:
+            self._dispatch_task.cancel()
+            try:
+                await self._dispatch_task
+            except asyncio.CancelledError:
+                pass
+            self._dispatch_task = None
+
+        if self._auth_task:
+            self._auth_task.cancel()
+            try:
+                await self._auth_task
+            except asyncio.CancelledError:
+                pass
+            self._auth_task = None
+
         if self._reconnect_task:
             self._reconnect_task.cancel()
             try:
@@ -372,24 +741,19 @@ class MeshClient:
                     break
                 
                 # Check for missed pongs
-                now = time.time()
-                if (self.state.last_ping and 
-                    self.state.last_pong and 
-                    (now - self.state.last_pong) > (self.options.heartbeat_interval * 2)):
+                now = time.monotonic()
+                if (self._last_ping_mono and
+                    self._last_pong_mono and
+                    (now - self._last_pong_mono) > (self.options.heartbeat_interval * 2)):
                     logger.warning("Heartbeat timeout - connection may be lost")
                     if self._websocket:
                         await self._websocket.close()
                     break
                 
                 # Send ping
-                self.state.last_ping = now
-                ping_message = create_ping_message(
-                    MessageEndpoint(mud=self.options.mud_name),
-                    MessageEndpoint(mud="Gateway")
-                )
-                
+                self._last_ping_mono = now
                 try:
-                    await self._send_message(ping_message)
+                    await self._out_queue.put(self._render_ping())
                 except Exception as e:
                     logger.error(f"Failed to send ping: {e}")
                     break
@@ -399,111 +763,148 @@ class MeshClient:
         except Exception as e:
             logger.error(f"Heartbeat loop error: {e}")
     
+    def _render_ping(self) -> str:
+        """Build a ping frame by patching the cached template."""
+        return (
+            self._ping_template
+            .replace(_PING_ID_PLACEHOLDER, self._next_id().encode())
+            .replace(_PING_ISO_PLACEHOLDER, datetime.now(timezone.utc).isoformat().encode())
+            .replace(_PING_MS_PLACEHOLDER, b"%d" % (time.time_ns() // 1_000_000))
+            .decode()
+        )
+
     async def _send_message(self, message: MeshMessage) -> None:
         """Send a message to the gateway."""
-        if not self._websocket or not self.state.connected:
+        if not self._websocket or not self.state.connected or self._out_queue is None:
             raise RuntimeError("Not connected to gateway")
         
-        # Convert message to dict for JSON serialization
-        message_dict = {
-            "version": message.version,
-            "id": message.id,
-            "timestamp": message.timestamp,
-            "type": message.type,
-            "from": {
-                "mud": message.from_endpoint.mud,
-                "user": message.from_endpoint.user,
-                "displayName": message.from_endpoint.display_name,
-                "channel": message.from_endpoint.channel,
-            },
-            "to": {
-                "mud": message.to_endpoint.mud,
-                "user": message.to_endpoint.user,
-                "displayName": message.to_endpoint.display_name,
-                "channel": message.to_endpoint.channel,
-            },
-            "payload": message.payload.__dict__ if hasattr(message.payload, '__dict__') else message.payload,
-            "metadata": message.metadata.__dict__ if hasattr(message.metadata, '__dict__') else message.metadata,
-        }
-        
+        # Populate the reusable wire dict in place, skipping None values
+        # in one pass instead of a recursive post-walk
+        scratch = self._scratch
+        scratch["version"] = message.version
+        scratch["id"] = message.id
+        scratch["timestamp"] = message.timestamp
+        scratch["type"] = message.type
+        scratch["from"] = _endpoint_to_dict(message.from_endpoint)
+        scratch["to"] = _endpoint_to_dict(message.to_endpoint)
+        scratch["payload"] = _payload_to_dict(message.payload)
+        scratch["metadata"] = _metadata_to_dict(message.metadata)
+
         if message.signature:
-            message_dict["signature"] = message.signature
-        
-        # Remove None values to clean up JSON
-        def remove_none(obj):
-            if isinstance(obj, dict):
-                return {k: remove_none(v) for k, v in obj.items() if v is not None}
-            return obj
-        
-        message_dict = remove_none(message_dict)
-        
+            scratch["signature"] = message.signature
+        else:
+            scratch.pop("signature", None)
+
+        # Encode here; the writer task drains the queue and does the actual
+        # sends. Frames are queued as str so they go out as WebSocket
+        # text frames, which is what the protocol documents — bytes
+        # would be sent as binary and spec-strict gateways may reject
+        # them. A full queue signals back-pressure before blocking.
+        frame = _json_dumps(scratch).decode()
+        try:
+            self._out_queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self._emit("send_backpressure", {"queued": self._out_queue.qsize()})
+            await self._out_queue.put(frame)
+
+    async def _writer_loop(self) -> None:
+        """Drain the outbound queue, coalescing bursts into one wakeup."""
         try:
-            await self._websocket.send(json.dumps(message_dict))
+            while self.state.connected and self._websocket:
+                batch = [await self._out_queue.get()]
+                while len(batch) < 128:
+                    try:
+                        batch.append(self._out_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                # Sending the whole batch on one loop tick amortizes wakeups
+                for frame in batch:
+                    await self._websocket.send(frame)
+
+                # Yield to the loop when the transport buffer is backed
+                # up so a slow gateway drains before the next batch
+                transport = getattr(self._websocket, "transport", None)
+                if (transport is not None
+                        and transport.get_write_buffer_size() > self.options.send_high_water_mark):
+                    await asyncio.sleep(0)
+
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
-            raise
-    
+            self._emit("error", f"Send failed: {e}")
+            if self._websocket:
+                await self._websocket.close()
+
     # Public API methods
     async def send_tell(self, to_endpoint: MessageEndpoint, message: str) -> None:
         """Send a tell message."""
         tell_message = create_tell_message(
-            MessageEndpoint(mud=self.options.mud_name, user="System"),
+            self._user_endpoint("System"),
             to_endpoint,
-            message
+            message,
+            id_factory=self._next_id
         )
         await self._send_message(tell_message)
     
     async def send_channel_message(self, channel: str, message: str, user: str = "System") -> None:
         """Send a channel message."""
         channel_message = create_channel_message(
-            MessageEndpoint(mud=self.options.mud_name, user=user),
+            self._user_endpoint(user),
             channel,
-            message
+            message,
+            id_factory=self._next_id
         )
         await self._send_message(channel_message)
     
     async def join_channel(self, channel: str, user: str = "System") -> None:
         """Join a channel."""
         join_message = create_channel_message(
-            MessageEndpoint(mud=self.options.mud_name, user=user),
+            self._user_endpoint(user),
             channel,
             "",
-            "join"
+            "join",
+            id_factory=self._next_id
         )
         await self._send_message(join_message)
     
     async def leave_channel(self, channel: str, user: str = "System") -> None:
         """Leave a channel."""
         leave_message = create_channel_message(
-            MessageEndpoint(mud=self.options.mud_name, user=user),
+            self._user_endpoint(user),
             channel,
             "",
-            "leave"
+            "leave",
+            id_factory=self._next_id
         )
         await self._send_message(leave_message)
     
     async def request_who(self, target_mud: str) -> None:
         """Request who list from a MUD."""
         who_message = create_who_request_message(
-            MessageEndpoint(mud=self.options.mud_name),
-            target_mud
+            self._self_endpoint,
+            target_mud,
+            id_factory=self._next_id
         )
         await self._send_message(who_message)
     
     async def request_finger(self, target_mud: str, target_user: str) -> None:
         """Request finger info for a user."""
         finger_message = create_finger_request_message(
-            MessageEndpoint(mud=self.options.mud_name),
+            self._self_endpoint,
             target_mud,
-            target_user
+            target_user,
+            id_factory=self._next_id
         )
         await self._send_message(finger_message)
     
     async def request_locate(self, target_user: str) -> None:
         """Locate a user across all MUDs."""
         locate_message = create_locate_request_message(
-            MessageEndpoint(mud=self.options.mud_name),
-            target_user
+            self._self_endpoint,
+            target_user,
+            id_factory=self._next_id
         )
         await self._send_message(locate_message)
     
@@ -511,13 +912,14 @@ class MeshClient:
         """Mark a user as online."""
         presence_message = create_message(
             "presence",
-            MessageEndpoint(mud=self.options.mud_name, user=user_info.username),
-            MessageEndpoint(mud="Gateway"),
+            self._user_endpoint(user_info.username),
+            self._gateway_endpoint,
             PresencePayload(
                 status="online",
                 activity=user_info.location,
                 location=user_info.location
-            )
+            ),
+            id_factory=self._next_id
         )
         await self._send_message(presence_message)
     
@@ -525,9 +927,10 @@ class MeshClient:
         """Mark a user as offline."""
         presence_message = create_message(
             "presence",
-            MessageEndpoint(mud=self.options.mud_name, user=username),
-            MessageEndpoint(mud="Gateway"),
-            PresencePayload(status="offline")
+            self._user_endpoint(username),
+            self._gateway_endpoint,
+            PresencePayload(status="offline"),
+            id_factory=self._next_id
         )
         await self._send_message(presence_message)
     
@@ -545,6 +948,12 @@ class MeshClient:
     @property
     def connection_state(self) -> ConnectionState:
         """Get current connection state."""
+        # Heartbeat bookkeeping runs on the monotonic clock; translate
+        # to epoch seconds here so last_ping/last_pong keep comparing
+        # against time.time() as they always have
+        offset = time.time() - time.monotonic()
+        self.state.last_ping = self._last_ping_mono + offset if self._last_ping_mono else None
+        self.state.last_pong = self._last_pong_mono + offset if self._last_pong_mono else None
         return self.state
     
     @property
@@ -1,9 +1,18 @@
 """Type definitions for MudVault Mesh protocol."""
 
+import sys
 from typing import Dict, List, Literal, Optional, Union, Any
 from dataclasses import dataclass
 from enum import IntEnum
 
+# slots=True needs Python 3.10; older versions fall back to plain dataclasses
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Value types (endpoints, metadata, payloads) are immutable: they can be
+# shared and cached safely, and frozen instances never need defensive
+# copies. State-carrying classes stay mutable.
+_FROZEN: Dict[str, Any] = {"frozen": True, **_SLOTS}
+
 
 class ErrorCodes(IntEnum):
     """Error codes used in the MudVault Mesh protocol."""
@@ -39,7 +48,7 @@ ChannelAction = Literal["join", "leave", "message", "list"]
 PresenceStatus = Literal["online", "offline", "away", "busy"]
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class MessageEndpoint:
     """Represents a message endpoint (from/to)."""
     mud: str
@@ -48,7 +57,7 @@ class MessageEndpoint:
     channel: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class MessageMetadata:
     """Message metadata for delivery options."""
     priority: int = 5
@@ -58,14 +67,14 @@ class MessageMetadata:
     retry: bool = False
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class TellPayload:
     """Payload for tell messages."""
     message: str
     formatted: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class EmotePayload:
     """Payload for emote messages."""
     action: str
@@ -73,7 +82,7 @@ class EmotePayload:
     formatted: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class ChannelPayload:
     """Payload for channel messages."""
     channel: str
@@ -82,14 +91,14 @@ class ChannelPayload:
     formatted: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class WhoPayload:
     """Payload for who requests/responses."""
     users: Optional[List["UserInfo"]] = None
     request: bool = False
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class FingerPayload:
     """Payload for finger requests/responses."""
     user: str
@@ -97,7 +106,7 @@ class FingerPayload:
     request: bool = False
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class LocatePayload:
     """Payload for locate requests/responses."""
     user: str
@@ -105,7 +114,7 @@ class LocatePayload:
     request: bool = False
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class PresencePayload:
     """Payload for presence updates."""
     status: PresenceStatus
@@ -113,7 +122,7 @@ class PresencePayload:
     location: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class AuthPayload:
     """Payload for authentication."""
     token: Optional[str] = None
@@ -122,13 +131,13 @@ class AuthPayload:
     response: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class PingPayload:
     """Payload for ping messages."""
     timestamp: int
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class ErrorPayload:
     """Payload for error messages."""
     code: int
@@ -151,7 +160,7 @@ MessagePayload = Union[
 ]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MeshMessage:
     """A complete MudVault Mesh protocol message."""
     version: str
@@ -165,7 +174,7 @@ class MeshMessage:
     signature: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class UserInfo:
     """Information about a user."""
     username: str
@@ -182,7 +191,7 @@ class UserInfo:
     plan: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class UserLocation:
     """Location information for a user."""
     mud: str
@@ -191,7 +200,7 @@ class UserLocation:
     online: bool = True
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConnectionState:
     """Current connection state."""
     connected: bool = False
@@ -201,12 +210,15 @@ class ConnectionState:
     last_pong: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MeshClientOptions:
     """Configuration options for MeshClient."""
     mud_name: str
     auto_reconnect: bool = True
+    use_uvloop: bool = False
     reconnect_interval: float = 5.0
+    reconnect_max_interval: float = 60.0
     max_reconnect_attempts: int = 10
     heartbeat_interval: float = 30.0
-    timeout: float = 10.0
\ No newline at end of file
+    timeout: float = 10.0
+    send_high_water_mark: int = 1_048_576
\ No newline at end of file
@@ -1,10 +1,14 @@
 """Utility functions for MudVault Mesh."""
 
-import uuid
+import os
 import time
 import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Iterator
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Iterable, List, Optional
 
 from .types import (
     MeshMessage,
@@ -23,6 +27,128 @@ from .types import (
     ErrorCodes,
 )
 
+# orjson serializes dataclasses natively in Rust; used for the display
+# fallback, where the pure-Python recursive __repr__ is the slow part
+try:
+    from orjson import dumps as _orjson_dumps
+except ImportError:
+    _orjson_dumps = None
+
+# ciso8601 parses ISO timestamps (including the Z suffix) in C, roughly
+# 60x faster than the manual replace + fromisoformat combination
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    def _parse_datetime(timestamp: str) -> datetime:
+        # Inspect the suffix instead of str.replace, which scans and
+        # copies the whole string even when no 'Z' is present
+        if timestamp.endswith('Z'):
+            return datetime.fromisoformat(timestamp[:-1]).replace(tzinfo=timezone.utc)
+        return datetime.fromisoformat(timestamp)
+
+
+@lru_cache(maxsize=4096)
+def _parse_ts(timestamp: str) -> float:
+    """Parse an ISO timestamp to epoch seconds, memoized.
+
+    Relays and periodic sweeps see the same timestamp string many times
+    (retries, fan-out copies, repeated TTL checks); the LRU turns those
+    repeats into a dict hit.
+    """
+    return _parse_datetime(timestamp).timestamp()
+
+
+# Bound locally so create_message skips repeated attribute lookups on
+# its hottest names
+_now = datetime.now
+_UTC = timezone.utc
+_time_ns = time.time_ns
+_VERSION = "1.0"
+
+# Timestamp pinned for the duration of a batch_timestamp() block;
+# context-local so concurrent tasks never see each other's value
+_current_ts: "ContextVar[Optional[str]]" = ContextVar("_current_ts", default=None)
+
+
+@contextmanager
+def batch_timestamp() -> Iterator[str]:
+    """Stamp every message created inside the block with one timestamp.
+
+    Fanning the same tell or channel message out to many endpoints
+    re-formats the current time per copy (~500 ns each); wrapping the
+    loop in this context manager formats it once.
+    """
+    timestamp = _now(_UTC).isoformat()
+    token = _current_ts.set(timestamp)
+    try:
+        yield timestamp
+    finally:
+        _current_ts.reset(token)
+
+
+def _fast_uuid4_str() -> str:
+    """Format a random version-4 UUID without uuid.UUID overhead.
+
+    Skips UUID.__init__ validation and __str__, which together cost
+    several times more than the urandom call itself.
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    h = b.hex()
+    return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+
+
+# Shared broadcast endpoint and per-channel endpoint cache; endpoints
+# are value objects, so reusing instances saves a constructor call per
+# outbound channel/locate message
+_ALL_MUDS = MessageEndpoint(mud="*")
+
+
+@lru_cache(maxsize=1024)
+def _channel_endpoint(channel: str) -> MessageEndpoint:
+    return MessageEndpoint(mud="*", channel=channel)
+
+
+# Compiled once at import; runs on the non-ASCII sanitization path
+_SANITIZE_RE = re.compile(r'[^\x20-\x7E\n\t]')
+
+# Deletion table stripping every permitted MUD-name character; a name
+# is valid iff translating it leaves nothing behind. str.translate runs
+# the scan in C without building an intermediate set.
+_MUD_NAME_STRIP = str.maketrans(
+    '', '', "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-"
+)
+
+# Bytes to delete from ASCII messages: control characters except
+# tab/newline. bytes.translate walks a 256-entry lookup table in C,
+# the fastest scan available without a compiled extension.
+_CONTROL_BYTES = bytes(i for i in range(0x20) if i not in (0x09, 0x0A)) + b'\x7f'
+
+
+def _create(
+    msg_type: MessageType,
+    from_endpoint: MessageEndpoint,
+    to_endpoint: MessageEndpoint,
+    payload: MessagePayload,
+    id_factory: Optional[Callable[[], str]] = None,
+) -> MeshMessage:
+    """Build a message with default metadata, skipping the None check.
+
+    Every create_*_message helper lands here; only callers passing
+    custom metadata pay for the branch in create_message.
+    """
+    return MeshMessage(
+        version=_VERSION,
+        id=id_factory() if id_factory is not None else _fast_uuid4_str(),
+        timestamp=_current_ts.get() or _now(_UTC).isoformat(),
+        type=msg_type,
+        from_endpoint=from_endpoint,
+        to_endpoint=to_endpoint,
+        payload=payload,
+        metadata=MessageMetadata(),
+    )
+
 
 def create_message(
     msg_type: MessageType,
@@ -30,15 +156,21 @@ def create_message(
     to_endpoint: MessageEndpoint,
     payload: MessagePayload,
     metadata: Optional[MessageMetadata] = None,
+    id_factory: Optional[Callable[[], str]] = None,
 ) -> MeshMessage:
-    """Create a new mesh message with required fields."""
+    """Create a new mesh message with required fields.
+
+    Args:
+        id_factory: Optional callable producing message ids; defaults to
+            random UUIDs. High-rate senders can supply a cheaper factory.
+    """
     if metadata is None:
-        metadata = MessageMetadata()
+        return _create(msg_type, from_endpoint, to_endpoint, payload, id_factory)
     
     return MeshMessage(
-        version="1.0",
-        id=str(uuid.uuid4()),
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        version=_VERSION,
+        id=id_factory() if id_factory is not None else _fast_uuid4_str(),
+        timestamp=_current_ts.get() or _now(_UTC).isoformat(),
         type=msg_type,
         from_endpoint=from_endpoint,
         to_endpoint=to_endpoint,
@@ -51,13 +183,15 @@ def create_tell_message(
     from_endpoint: MessageEndpoint,
     to_endpoint: MessageEndpoint,
     message: str,
+    id_factory: Optional[Callable[[], str]] = None,
 ) -> MeshMessage:
     """Create a tell message."""
-    return create_message(
+    return _create(
         "tell",
         from_endpoint,
         to_endpoint,
         TellPayload(message=message),
+        id_factory=id_factory,
     )
 
 
@@ -66,28 +200,32 @@ def create_channel_message(
     channel: str,
     message: str,
     action: ChannelAction = "message",
+    id_factory: Optional[Callable[[], str]] = None,
 ) -> MeshMessage:
     """Create a channel message."""
-    to_endpoint = MessageEndpoint(mud="*", channel=channel)
-    return create_message(
+    to_endpoint = _channel_endpoint(channel)
+    return _create(
         "channel",
         from_endpoint,
         to_endpoint,
         ChannelPayload(channel=channel, message=message, action=action),
+        id_factory=id_factory,
     )
 
 
 def create_who_request_message(
     from_endpoint: MessageEndpoint,
     target_mud: str,
+    id_factory: Optional[Callable[[], str]] = None,
 ) -> MeshMessage:
     """Create a who request message."""
     to_endpoint = MessageEndpoint(mud=target_mud)
-    return create_message(
+    return _create(
         "who",
         from_endpoint,
         to_endpoint,
         WhoPayload(request=True),
+        id_factory=id_factory,
     )
 
 
@@ -95,28 +233,31 @@ def create_finger_request_message(
     from_endpoint: MessageEndpoint,
     target_mud: str,
     target_user: str,
+    id_factory: Optional[Callable[[], str]] = None,
 ) -> MeshMessage:
     """Create a finger request message."""
     to_endpoint = MessageEndpoint(mud=target_mud, user=target_user)
-    return create_message(
+    return _create(
         "finger",
         from_endpoint,
         to_endpoint,
         FingerPayload(user=target_user, request=True),
+        id_factory=id_factory,
     )
 
 
 def create_locate_request_message(
     from_endpoint: MessageEndpoint,
     target_user: str,
+    id_factory: Optional[Callable[[], str]] = None,
 ) -> MeshMessage:
     """Create a locate request message."""
-    to_endpoint = MessageEndpoint(mud="*")
-    return create_message(
+    return _create(
         "locate",
         from_endpoint,
-        to_endpoint,
+        _ALL_MUDS,
         LocatePayload(user=target_user, request=True),
+        id_factory=id_factory,
     )
 
 
@@ -125,11 +266,11 @@ def create_ping_message(
     to_endpoint: MessageEndpoint,
 ) -> MeshMessage:
     """Create a ping message."""
-    return create_message(
+    return _create(
         "ping",
         from_endpoint,
         to_endpoint,
-        PingPayload(timestamp=int(time.time() * 1000)),
+        PingPayload(timestamp=_time_ns() // 1_000_000),
     )
 
 
@@ -137,13 +278,15 @@ def create_pong_message(
     from_endpoint: MessageEndpoint,
     to_endpoint: MessageEndpoint,
     original_timestamp: int,
+    id_factory: Optional[Callable[[], str]] = None,
 ) -> MeshMessage:
     """Create a pong message."""
-    return create_message(
+    return _create(
         "pong",
         from_endpoint,
         to_endpoint,
         PingPayload(timestamp=original_timestamp),
+        id_factory=id_factory,
     )
 
 
@@ -155,7 +298,7 @@ def create_error_message(
     details: Optional[Dict[str, Any]] = None,
 ) -> MeshMessage:
     """Create an error message."""
-    return create_message(
+    return _create(
         "error",
         from_endpoint,
         to_endpoint,
@@ -166,20 +309,40 @@ def create_error_message(
 def is_expired(message: MeshMessage) -> bool:
     """Check if a message has expired based on its TTL."""
     try:
-        message_time = datetime.fromisoformat(message.timestamp.replace('Z', '+00:00'))
-        now = datetime.now(timezone.utc)
-        ttl_seconds = message.metadata.ttl
-        
-        return (now - message_time).total_seconds() > ttl_seconds
-    except (ValueError, AttributeError):
+        # Compare epoch seconds directly; skips the aware-datetime
+        # subtraction and timedelta allocation
+        return time.time() - _parse_ts(message.timestamp) > message.metadata.ttl
+    except (ValueError, AttributeError, TypeError):
         # If we can't parse the timestamp, consider it expired
         return True
 
 
+def are_expired(messages: Iterable[MeshMessage]) -> List[bool]:
+    """Check TTL expiry for a batch of messages against a single clock read.
+
+    Brokers sweeping large queues should prefer this over calling
+    is_expired per message: the wall-clock is sampled once and the loop
+    avoids repeated global lookups.
+    """
+    now = time.time()
+    parse = _parse_ts
+    results = []
+    append = results.append
+    for message in messages:
+        try:
+            append(now - parse(message.timestamp) > message.metadata.ttl)
+        except (ValueError, AttributeError, TypeError):
+            append(True)
+    return results
+
+
 def sanitize_message(message: str, max_length: int = 4096) -> str:
     """Sanitize a message string."""
     # Remove non-printable ASCII characters except newlines/tabs
-    sanitized = re.sub(r'[^\x20-\x7E\n\t]', '', message)
+    if message.isascii():
+        sanitized = message.encode('ascii').translate(None, _CONTROL_BYTES).decode('ascii')
+    else:
+        sanitized = _SANITIZE_RE.sub('', message)
     
     # Truncate to max length
     if len(sanitized) > max_length:
@@ -190,45 +353,70 @@ def sanitize_message(message: str, max_length: int = 4096) -> str:
 
 def validate_mud_name(mud_name: str) -> bool:
     """Validate a MUD name according to mesh protocol rules."""
-    if not mud_name or not isinstance(mud_name, str):
+    # Cheap rejects first: almost all invalid inputs fail on type or
+    # length before the character scan runs
+    if not isinstance(mud_name, str):
         return False
     
     # Must be 1-64 characters, alphanumeric plus underscore/dash
-    if not re.match(r'^[a-zA-Z0-9_-]{1,64}$', mud_name):
+    length = len(mud_name)
+    if length == 0 or length > 64:
         return False
-    
-    return True
+    return not mud_name.translate(_MUD_NAME_STRIP)
+
+
+def _format_tell(payload: Dict[str, Any], sender: str) -> Optional[str]:
+    if "message" in payload:
+        return f"{sender} tells you: {payload['message']}"
+    return None
+
+
+def _format_channel(payload: Dict[str, Any], sender: str) -> Optional[str]:
+    # Pull each key once; every .get is a method lookup plus a C call
+    action = payload.get("action")
+    channel = payload.get("channel")
+    if action == "join":
+        return f"{sender} has joined channel {channel}"
+    if action == "leave":
+        return f"{sender} has left channel {channel}"
+    return f"[{channel}] {sender}: {payload.get('message', '')}"
+
+
+def _format_emote(payload: Dict[str, Any], sender: str) -> Optional[str]:
+    if "action" in payload:
+        return f"{sender} {payload['action']}"
+    return None
+
+
+def _format_error(payload: Dict[str, Any], sender: str) -> Optional[str]:
+    return f"Error {payload.get('code', 'Unknown')}: {payload.get('message', 'Unknown error')}"
+
+
+# O(1) formatter dispatch instead of an if/elif chain per message type
+_FORMATTERS = {
+    "tell": _format_tell,
+    "channel": _format_channel,
+    "emote": _format_emote,
+    "error": _format_error,
+}
 
 
 def format_message_for_display(message: MeshMessage) -> str:
     """Format a message for display in a MUD."""
     try:
-        if message.type == "tell":
-            payload = message.payload
-            if isinstance(payload, dict) and "message" in payload:
-                return f"{message.from_endpoint.user}@{message.from_endpoint.mud} tells you: {payload['message']}"
-        
-        elif message.type == "channel":
-            payload = message.payload
-            if isinstance(payload, dict):
-                if payload.get("action") == "join":
-                    return f"{message.from_endpoint.user}@{message.from_endpoint.mud} has joined channel {payload.get('channel')}"
-                elif payload.get("action") == "leave":
-                    return f"{message.from_endpoint.user}@{message.from_endpoint.mud} has left channel {payload.get('channel')}"
-                else:
-                    return f"[{payload.get('channel')}] {message.from_endpoint.user}@{message.from_endpoint.mud}: {payload.get('message', '')}"
-        
-        elif message.type == "emote":
-            payload = message.payload
-            if isinstance(payload, dict) and "action" in payload:
-                return f"{message.from_endpoint.user}@{message.from_endpoint.mud} {payload['action']}"
-        
-        elif message.type == "error":
-            payload = message.payload
-            if isinstance(payload, dict):
-                return f"Error {payload.get('code', 'Unknown')}: {payload.get('message', 'Unknown error')}"
+        payload = message.payload
+        formatter = _FORMATTERS.get(message.type)
+        if formatter is not None and isinstance(payload, dict):
+            # Build the sender string once instead of per branch
+            sender = f"{message.from_endpoint.user}@{message.from_endpoint.mud}"
+            formatted = formatter(payload, sender)
+            if formatted is not None:
+                return formatted
         
-        # Fallback to JSON representation
+        # Fallback to JSON representation; the dataclass __repr__ walks
+        # the nested objects in pure Python and is far slower
+        if _orjson_dumps is not None:
+            return _orjson_dumps(message).decode()
         return str(message)
     
     except Exception:
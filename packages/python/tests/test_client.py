@@ -0,0 +1,201 @@
+"""Tests for MeshClient wire behavior: ids, serialization, heartbeats."""
+
+import asyncio
+import json
+import time
+import uuid
+
+from mudvault_mesh import MeshClient, MessageEndpoint
+from mudvault_mesh.utils import create_tell_message
+
+
+def _connected_client() -> MeshClient:
+    """Return a client wired to a local queue instead of a socket."""
+    client = MeshClient("TestMUD")
+    client.state.connected = True
+    client._websocket = object()  # only truth-tested by _send_message
+    client._out_queue = asyncio.Queue(maxsize=1024)
+    return client
+
+
+def _baseline_wire_dict(message):
+    """Serialize a message the way the original client did."""
+    message_dict = {
+        "version": message.version,
+        "id": message.id,
+        "timestamp": message.timestamp,
+        "type": message.type,
+        "from": {
+            "mud": message.from_endpoint.mud,
+            "user": message.from_endpoint.user,
+            "displayName": message.from_endpoint.display_name,
+            "channel": message.from_endpoint.channel,
+        },
+        "to": {
+            "mud": message.to_endpoint.mud,
+            "user": message.to_endpoint.user,
+            "displayName": message.to_endpoint.display_name,
+            "channel": message.to_endpoint.channel,
+        },
+        "payload": {"message": message.payload.message, "formatted": message.payload.formatted},
+        "metadata": {
+            "priority": message.metadata.priority,
+            "ttl": message.metadata.ttl,
+            "encoding": message.metadata.encoding,
+            "language": message.metadata.language,
+            "retry": message.metadata.retry,
+        },
+    }
+    if message.signature:
+        message_dict["signature"] = message.signature
+
+    def remove_none(obj):
+        if isinstance(obj, dict):
+            return {k: remove_none(v) for k, v in obj.items() if v is not None}
+        return obj
+
+    return remove_none(message_dict)
+
+
+def test_off_removes_bound_method_handler():
+    client = MeshClient("TestMUD")
+
+    class App:
+        def __init__(self):
+            self.seen = []
+
+        def on_message(self, message):
+            self.seen.append(message)
+
+    app = App()
+    client.on("message", app.on_message)
+    # A fresh bound-method reference compares equal but is not identical
+    client.off("message", app.on_message)
+
+    client._emit("message", "hello")
+    assert app.seen == []
+
+
+def test_message_ids_are_valid_v4_uuids():
+    client = MeshClient("TestMUD")
+    ids = [client._next_id() for _ in range(1000)]
+
+    assert len(set(ids)) == len(ids)
+    for message_id in ids:
+        parsed = uuid.UUID(message_id)
+        assert parsed.version == 4
+        assert str(parsed) == message_id
+
+
+def test_message_ids_differ_between_clients():
+    first = MeshClient("TestMUD")
+    second = MeshClient("TestMUD")
+    assert first._next_id() != second._next_id()
+
+
+def test_send_serialization_matches_baseline():
+    client = _connected_client()
+    message = create_tell_message(
+        MessageEndpoint(mud="TestMUD", user="System"),
+        MessageEndpoint(mud="OtherMUD", user="alice"),
+        "hello there",
+        id_factory=client._next_id,
+    )
+
+    asyncio.run(client._send_message(message))
+    frame = client._out_queue.get_nowait()
+
+    assert json.loads(frame) == _baseline_wire_dict(message)
+
+
+def test_outbound_frames_are_text():
+    client = _connected_client()
+    message = create_tell_message(
+        MessageEndpoint(mud="TestMUD", user="System"),
+        MessageEndpoint(mud="OtherMUD", user="alice"),
+        "hi",
+        id_factory=client._next_id,
+    )
+
+    asyncio.run(client._send_message(message))
+    assert isinstance(client._out_queue.get_nowait(), str)
+    assert isinstance(client._render_ping(), str)
+
+
+def test_rendered_ping_is_protocol_valid():
+    client = MeshClient("TestMUD")
+    frame = json.loads(client._render_ping())
+
+    assert frame["type"] == "ping"
+    assert uuid.UUID(frame["id"]).version == 4
+    # Payload timestamp is epoch milliseconds, not process uptime
+    assert abs(frame["payload"]["timestamp"] - time.time_ns() // 1_000_000) < 2000
+
+
+def test_heartbeat_sniff_consumes_real_pong():
+    client = MeshClient("TestMUD")
+    pong = json.dumps(
+        {
+            "version": "1.0",
+            "id": str(uuid.uuid4()),
+            "timestamp": "2025-01-08T12:00:00+00:00",
+            "type": "pong",
+            "from": {"mud": "Gateway"},
+            "to": {"mud": "TestMUD"},
+            "payload": {"timestamp": time.time_ns() // 1_000_000},
+            "metadata": {},
+        },
+        separators=(",", ":"),
+    )
+
+    assert asyncio.run(client._maybe_fast_heartbeat(pong)) is True
+    assert asyncio.run(client._maybe_fast_heartbeat(pong.encode())) is True
+
+
+def test_heartbeat_reply_failure_is_contained():
+    client = MeshClient("TestMUD")  # not connected: the pong reply raises
+    errors = []
+    client.on("error", lambda e: errors.append(e))
+    ping = json.dumps(
+        {
+            "version": "1.0",
+            "id": str(uuid.uuid4()),
+            "timestamp": "2025-01-08T12:00:00+00:00",
+            "type": "ping",
+            "from": {"mud": "Gateway"},
+            "to": {"mud": "TestMUD"},
+            "payload": {"timestamp": 12345},
+            "metadata": {},
+        },
+        separators=(",", ":"),
+    )
+
+    # Must not propagate into the listen loop
+    asyncio.run(client._handle_message(ping))
+    assert errors
+
+
+def test_heartbeat_sniff_ignores_nested_heartbeat_shapes():
+    client = MeshClient("TestMUD")
+    # An error legitimately echoing an offending ping in its details
+    # must reach the full parse path, not be eaten as a heartbeat
+    error = json.dumps(
+        {
+            "version": "1.0",
+            "id": str(uuid.uuid4()),
+            "timestamp": "2025-01-08T12:00:00+00:00",
+            "type": "error",
+            "from": {"mud": "Gateway"},
+            "to": {"mud": "TestMUD"},
+            "payload": {
+                "code": 1000,
+                "message": "invalid ping",
+                "details": {"type": "ping", "timestamp": 12345},
+            },
+            "metadata": {},
+        },
+        separators=(",", ":"),
+    )
+
+    assert asyncio.run(client._maybe_fast_heartbeat(error)) is False
+    assert asyncio.run(client._maybe_fast_heartbeat(error.encode())) is False